@@ -0,0 +1,170 @@
+"""
+Load the CSV files listed in configs/airbyte_source_config.ndjson straight into
+PostgreSQL with COPY FROM STDIN, without going through Airbyte.
+
+Each file lands in <target_schema>.<table> as all-TEXT columns named after the
+CSV header, the same raw shape an Airbyte full refresh produces. Files are
+loaded concurrently, each streamed to the server as raw bytes, so no rows are
+parsed in Python.
+
+Run scripts/setup_airbyte_config.py first to generate the config.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from pathlib import Path
+
+import psycopg
+import pyarrow as pa
+import pyarrow.csv as pv
+from psycopg import sql
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_FILE = PROJECT_ROOT / "configs" / "airbyte_source_config.ndjson"
+DSN = "host=127.0.0.1 port=5432 dbname=olist_analytics user=olist_user password=olist_pass123"
+
+# Bytes read from the CSV and handed to COPY per write
+COPY_BLOCK_SIZE = 1 << 20
+
+# Rows per multi-row INSERT in the fallback path; PostgreSQL gains little
+# from batches beyond about 1,000 rows
+INSERT_BATCH_ROWS = 1000
+
+def read_header(file_path):
+    """Return the column names from a CSV's header row"""
+    with open(file_path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f))
+
+async def prepare_table(cur, table_id, columns):
+    """Create the all-TEXT raw table if needed and empty it"""
+    await cur.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+        table_id,
+        sql.SQL(", ").join(sql.SQL("{} TEXT").format(sql.Identifier(col)) for col in columns)
+    ))
+    await cur.execute(sql.SQL("TRUNCATE {}").format(table_id))
+
+async def copy_file(schema, table, file_path):
+    """Recreate the contents of one raw table from a CSV with COPY on its own connection"""
+    columns = read_header(file_path)
+    table_id = sql.Identifier(schema, table)
+
+    async with await psycopg.AsyncConnection.connect(DSN) as conn:
+        async with conn.transaction(), conn.cursor() as cur:
+            await prepare_table(cur, table_id, columns)
+
+            copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, HEADER true)").format(
+                table_id,
+                sql.SQL(", ").join(map(sql.Identifier, columns))
+            )
+            async with cur.copy(copy_sql) as copy:
+                with open(file_path, "rb") as f:
+                    while block := f.read(COPY_BLOCK_SIZE):
+                        await copy.write(block)
+            return cur.rowcount
+
+def insert_sql(table_id, columns, row_count):
+    """Build a multi-row INSERT with placeholders for row_count rows"""
+    row = sql.SQL("({})").format(sql.SQL(", ").join(sql.Placeholder() * len(columns)))
+    return sql.SQL("INSERT INTO {} ({}) VALUES {}").format(
+        table_id,
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+        sql.SQL(", ").join([row] * row_count)
+    )
+
+def read_rows(file_path, columns):
+    """Stream a CSV's rows as all-text RecordBatches, with NULLs as COPY's CSV format reads them"""
+    return pv.open_csv(
+        file_path,
+        # Any file in the config may hold quoted line breaks
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+        convert_options=pv.ConvertOptions(
+            column_types={col: pa.string() for col in columns},
+            # Unquoted empty fields are NULL and quoted ones ("") stay empty strings;
+            # csv.reader can't tell the two apart
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False
+        )
+    )
+
+async def insert_file(schema, table, file_path):
+    """Fallback for targets that can't take COPY (e.g. tables with triggers): batched INSERTs"""
+    columns = read_header(file_path)
+    table_id = sql.Identifier(schema, table)
+
+    rows = 0
+    async with await psycopg.AsyncConnection.connect(DSN) as conn:
+        # Rendered once; composing a 1,000-row statement per batch costs more than sending it
+        full_batch_sql = insert_sql(table_id, columns, INSERT_BATCH_ROWS).as_string(conn)
+        async with conn.transaction(), conn.cursor() as cur:
+            await prepare_table(cur, table_id, columns)
+
+            # Only one block of parsed rows is held at a time, sent in statements of
+            # INSERT_BATCH_ROWS rows
+            for block in read_rows(file_path, columns):
+                for offset in range(0, block.num_rows, INSERT_BATCH_ROWS):
+                    batch = block.slice(offset, INSERT_BATCH_ROWS)
+                    statement = full_batch_sql if batch.num_rows == INSERT_BATCH_ROWS else insert_sql(table_id, columns, batch.num_rows)
+                    values = zip(*(column.to_pylist() for column in batch.columns))
+                    await cur.execute(statement, [value for row in values for value in row])
+                    rows += batch.num_rows
+    return rows
+
+def read_config():
+    """Read the ND-JSON config line by line: the target schema, then the file entries"""
+    with open(CONFIG_FILE) as f:
+        schema = json.loads(next(f))["_meta"]["target_schema"]
+        entries = [json.loads(line) for line in f if line.strip()]
+    return schema, entries
+
+async def copy_all(schema, entries, load_file=copy_file):
+    """Load every configured CSV file into its raw table, all files at once"""
+
+    async with await psycopg.AsyncConnection.connect(DSN, autocommit=True) as conn:
+        await conn.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema)))
+
+    # The raw tables are independent, so each file gets its own connection and the
+    # server-side work of all nine loads overlaps
+    entries = [entry for entry in entries if (PROJECT_ROOT / entry["file"]).exists()]
+    results = await asyncio.gather(
+        *(load_file(schema, entry["table"], PROJECT_ROOT / entry["file"]) for entry in entries),
+        return_exceptions=True
+    )
+    return dict(zip((entry["file"] for entry in entries), results))
+
+def copy_load(use_insert=False):
+    """Load every configured CSV file and report each result"""
+
+    schema, entries = read_config()
+
+    results = asyncio.run(copy_all(schema, entries, insert_file if use_insert else copy_file))
+
+    failed = []
+    for entry in entries:
+        result = results.get(entry["file"])
+        if result is None:
+            print(f"✗ File not found: {entry['file']}")
+            failed.append(entry["file"])
+        elif isinstance(result, Exception):
+            print(f"✗ {entry['file']}: {result}")
+            failed.append(entry["file"])
+        else:
+            print(f"✓ {schema}.{entry['table']}: {result:,} rows")
+
+    return not failed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load the Airbyte CSV file list into PostgreSQL")
+    parser.add_argument(
+        "--insert",
+        action="store_true",
+        help=f"use batched INSERTs ({INSERT_BATCH_ROWS:,} rows each) instead of COPY"
+    )
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        # psycopg's async connections need a selector event loop on Windows
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    sys.exit(0 if copy_load(use_insert=args.insert) else 1)
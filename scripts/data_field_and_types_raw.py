@@ -1,83 +1,479 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.feather as feather
+from pandas.tseries.api import guess_datetime_format
 import os
+import io
+import argparse
+import sys
 import json
+import pickle
+try:
+    import orjson
+except ImportError:  # optional, json is used when it is not installed
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 
-def analyze_csv_files(data_directory: str) -> Dict[str, Dict[str, Any]]:
+# Rows parsed per chunk when streaming a CSV with pandas
+CHUNK_SIZE = 200_000
+
+# Bytes parsed per block when streaming a CSV with pyarrow
+ARROW_BLOCK_SIZE = 32 << 20
+
+# Stop tracking distinct values for a column once this many have been seen
+UNIQUE_CAP = 1_000_000
+
+# Rows read from the top of each file for sample values and type inference
+INFERENCE_ROWS = 10_000
+
+# Number of non-null values used to infer a column's suggested type
+INFERENCE_SAMPLE_SIZE = 100
+
+# Share of sample values that must parse for a datetime/numeric suggestion
+INFERENCE_MATCH_RATIO = 0.95
+
+# NumPy dtype kinds (signed, unsigned, float) handled as numeric columns
+_NUMERIC_KINDS = 'iuf'
+
+# Suggested type by NumPy dtype kind for columns that are already typed
+_SUGGESTED_TYPES = {'i': 'numeric', 'u': 'numeric', 'f': 'numeric', 'M': 'datetime'}
+
+# Datetime formats found so far; tried before guessing a format for a new column
+_DETECTED_FORMATS: List[str] = []
+
+# String columns whose head has fewer distinct values than this share of rows
+# are dictionary-encoded while streaming
+DICTIONARY_RATIO = 0.5
+
+def _new_column_stats() -> Dict[str, Any]:
+    """
+    Create an empty accumulator for streaming column statistics.
+    
+    Returns:
+        Dict[str, Any]: Accumulator consumed by _update_column_stats
+    """
+    return {
+        'dtype': None,
+        'non_null_count': 0,
+        'null_count': 0,
+        'seen': set(),
+        'unique_capped': False
+    }
+
+def _merge_distinct_values(seen: Union[set, np.ndarray], series: pd.Series) -> Union[set, np.ndarray]:
+    """
+    Merge the distinct non-null values of a chunk into the values seen so far.
+    
+    The first chunk's distinct values are kept as the array they come in, so
+    files that fit in a single block (most Olist files) never build a set:
+    for high-cardinality ID columns that would hash every value a second time.
+    Numeric columns stay a sorted NumPy array merged with np.union1d, so
+    prices and coordinates are never boxed into Python objects. Anything
+    else moves over to a set once a second chunk arrives.
+    
+    Args:
+        seen (Union[set, np.ndarray]): Distinct values from previous chunks
+        series (pd.Series): The column values for the current chunk
+        
+    Returns:
+        Union[set, np.ndarray]: Distinct values including the current chunk
+    """
+    numeric = series.dtype.kind in _NUMERIC_KINDS
+    if numeric:
+        values = series.to_numpy()
+        if values.dtype.kind == 'f':
+            values = values[~np.isnan(values)]
+        distinct = np.unique(values)
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        # Only the dictionary entries in use need hashing, not every row
+        codes = series.cat.codes.to_numpy()
+        distinct = series.cat.categories[np.unique(codes[codes >= 0])].to_numpy()
+    else:
+        distinct = series.dropna().unique()
+    
+    if not len(seen):
+        return distinct
+    if numeric and isinstance(seen, np.ndarray) and seen.dtype.kind in _NUMERIC_KINDS:
+        return np.union1d(seen, distinct)
+    if not isinstance(seen, set):
+        seen = set(seen.tolist())
+    seen.update(distinct.tolist())
+    return seen
+
+def _update_column_stats(stats: Dict[str, Any], series: pd.Series, non_null_count: np.integer):
+    """
+    Fold one chunk of a column into its accumulator.
+    
+    Args:
+        stats (Dict[str, Any]): Accumulator from _new_column_stats
+        series (pd.Series): The column values for the current chunk
+        non_null_count (np.integer): Non-null values in the chunk, from a frame-level count
+    """
+    # Dictionary-encoded columns report the type of their values
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    
+    # Chunks are typed independently, so promote to a dtype covering all of them
+    if stats['dtype'] is None:
+        stats['dtype'] = dtype
+    else:
+        try:
+            stats['dtype'] = np.result_type(stats['dtype'], dtype)
+        except TypeError:
+            stats['dtype'] = np.dtype(object)
+    
+    stats['non_null_count'] += non_null_count
+    stats['null_count'] += len(series) - non_null_count
+    
+    if not stats['unique_capped']:
+        seen = _merge_distinct_values(stats['seen'], series)
+        if len(seen) >= UNIQUE_CAP:
+            # Too many distinct values to keep in memory; report a lower bound
+            stats['unique_capped'] = True
+            stats['unique_count'] = len(seen)
+            seen = set()
+        stats['seen'] = seen
+
+def _first_non_null(series: pd.Series, n: int) -> pd.Series:
+    """
+    Get the first n non-null values of a series.
+    
+    Olist columns are mostly populated, so a short peek at the top usually
+    has enough values; the full dropna scan only runs when it does not.
+    
+    Args:
+        series (pd.Series): Column values
+        n (int): Number of non-null values wanted
+        
+    Returns:
+        pd.Series: Up to n non-null values, in order
+    """
+    peek = series.head(2 * n)
+    picked = peek[peek.notna()].head(n)
+    if len(picked) < n and len(series) > len(peek):
+        picked = series.dropna().head(n)
+    return picked
+
+def _datetime_ratio(sample: pd.Series) -> float:
+    """
+    Share of sample values that parse as datetimes.
+    
+    Formats already detected in other columns are tried first; otherwise the
+    format is guessed once from the first value so that parsing always takes
+    the fixed-format path instead of per-value dateutil fallback.
+    
+    Args:
+        sample (pd.Series): Non-null values from the top of the column
+        
+    Returns:
+        float: Fraction of values that parsed, 0.0 if no format applies
+    """
+    if sample.empty:
+        return 0.0
+    
+    for fmt in _DETECTED_FORMATS:
+        ratio = pd.to_datetime(sample, format=fmt, errors='coerce', cache=True).notna().mean()
+        if ratio > INFERENCE_MATCH_RATIO:
+            return ratio
+    
+    fmt = guess_datetime_format(str(sample.iloc[0]))
+    if fmt is None or fmt in _DETECTED_FORMATS:
+        return 0.0
+    
+    ratio = pd.to_datetime(sample, format=fmt, errors='coerce', cache=True).notna().mean()
+    if ratio > INFERENCE_MATCH_RATIO:
+        _DETECTED_FORMATS.append(fmt)
+    return ratio
+
+def _infer_object_type(sample: pd.Series) -> str:
+    """
+    Suggest a type for a column that pandas read as object.
+    
+    Args:
+        sample (pd.Series): Non-null values from the top of the column
+        
+    Returns:
+        str: 'datetime', 'numeric' or 'string'
+    """
+    # Coerce instead of raising and check how much of the sample parsed
+    if _datetime_ratio(sample) > INFERENCE_MATCH_RATIO:
+        return 'datetime'
+    # Check if it's numeric but stored as string
+    if pd.to_numeric(sample, errors='coerce').notna().mean() > INFERENCE_MATCH_RATIO:
+        return 'numeric'
+    return 'string'
+
+def _dictionary_columns(head_df: pd.DataFrame) -> List[str]:
+    """
+    Pick the low-cardinality string columns worth dictionary-encoding.
+    
+    Olist repeats a handful of values in columns like states, statuses and
+    payment types; encoding them means distinct values are tracked per
+    dictionary entry instead of per row.
+    
+    Args:
+        head_df (pd.DataFrame): The first INFERENCE_ROWS rows of the file, as text
+        
+    Returns:
+        List[str]: Names of the columns to read as dictionaries
+    """
+    if head_df.empty:
+        return []
+    
+    columns = []
+    for column, values in head_df.items():
+        if values.nunique() / len(values) >= DICTIONARY_RATIO:
+            continue
+        # Leave dates and numbers to the reader's own type inference
+        if _infer_object_type(_first_non_null(values, INFERENCE_SAMPLE_SIZE)) == 'string':
+            columns.append(column)
+    return columns
+
+def _finalize_column_stats(stats: Dict[str, Any], head: pd.Series) -> Dict[str, Any]:
+    """
+    Turn a column accumulator into the column info reported for a file.
+    
+    Args:
+        stats (Dict[str, Any]): Accumulator from _new_column_stats
+        head (pd.Series): The column's text from the first INFERENCE_ROWS rows
+        
+    Returns:
+        Dict[str, Any]: Column info with dtype, counts, samples and suggested type
+    """
+    dtype = stats['dtype']
+    sample = _first_non_null(head, INFERENCE_SAMPLE_SIZE)
+    
+    column_info = {
+        'dtype': str(dtype),
+        'non_null_count': stats['non_null_count'],
+        'null_count': stats['null_count'],
+        'unique_count': stats['unique_count'] if stats['unique_capped'] else len(stats['seen']),
+        'sample_values': sample.head(3).tolist()
+    }
+    if dtype.kind in _NUMERIC_KINDS:
+        # The head is read as text; report numeric samples in the column's own dtype
+        column_info['sample_values'] = pd.to_numeric(sample.head(3)).astype(dtype).tolist()
+    if stats['unique_capped']:
+        column_info['unique_count_is_lower_bound'] = True
+    
+    # Try to infer better data type; only object columns need to look at values
+    if dtype.kind == 'O':
+        column_info['suggested_type'] = _infer_object_type(sample)
+    else:
+        column_info['suggested_type'] = _SUGGESTED_TYPES.get(dtype.kind, str(dtype))
+    
+    return column_info
+
+def _iter_arrow_chunks(file_path: str, dictionary_columns: List[str],
+                       newlines_in_values: bool = False) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV through pyarrow's multithreaded reader as DataFrame chunks.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        dictionary_columns (List[str]): Columns to read as dictionary-encoded strings
+        newlines_in_values (bool): Allow quoted line breaks, at the cost of slower
+            multithreaded parsing
+        
+    Yields:
+        pd.DataFrame: An empty frame carrying the schema, then one frame per block
+    """
+    reader = pv.open_csv(
+        file_path,
+        read_options=pv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True),
+        parse_options=pv.ParseOptions(newlines_in_values=newlines_in_values),
+        convert_options=pv.ConvertOptions(
+            column_types={column: pa.dictionary(pa.int32(), pa.string()) for column in dictionary_columns},
+            # Match pandas, which reads empty strings as missing
+            strings_can_be_null=True
+        )
+    )
+    yield reader.schema.empty_table().to_pandas()
+    for batch in reader:
+        yield batch.to_pandas()
+
+def _scan_chunks(chunks: Iterable[pd.DataFrame]) -> Tuple[List[str], int, Dict[str, Dict[str, Any]]]:
+    """
+    Accumulate row count and per-column statistics over a stream of chunks.
+    
+    Args:
+        chunks (Iterable[pd.DataFrame]): The CSV contents, chunk by chunk
+        
+    Returns:
+        Tuple[List[str], int, Dict[str, Dict[str, Any]]]: Column names, total rows and column accumulators
+    """
+    total_rows = 0
+    columns = None
+    stats = {}
+    
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.columns)
+            stats = {column: _new_column_stats() for column in columns}
+        # Count rows from the parse rather than by counting newlines in the raw
+        # bytes: review comments hold quoted line breaks that would be overcounted
+        total_rows += len(chunk)
+        
+        # One vectorized sweep over the whole chunk instead of one per column
+        counts = chunk.count()
+        for column, series in chunk.items():
+            _update_column_stats(stats[column], series, counts[column])
+    
+    return columns, total_rows, stats
+
+def _analyze_one(file_path: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Analyze a single CSV file. Runs in a worker process, so it does not print.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        Tuple[str, Dict[str, Any]]: The file name and its file info (or error)
+    """
+    csv_file = os.path.basename(file_path)
+    
+    try:
+        # Sample values and suggested types only need the top of the file
+        # Read as text: the streaming pass decides the dtypes, so skip pandas' inference here
+        head_df = pd.read_csv(file_path, nrows=INFERENCE_ROWS, dtype=str)
+        dictionary_columns = _dictionary_columns(head_df)
+        
+        # Quoted line breaks (review comments) slow pyarrow's parsing down, so only
+        # allow them for files whose head has some
+        newlines_in_values = any(head_df[column].str.contains('\n', regex=False).any() for column in head_df)
+        
+        # Stream the CSV in blocks so memory stays bounded by the block size
+        try:
+            try:
+                columns, total_rows, stats = _scan_chunks(
+                    _iter_arrow_chunks(file_path, dictionary_columns, newlines_in_values)
+                )
+            except pa.ArrowInvalid:
+                if newlines_in_values:
+                    raise
+                # A line break further down split a row across blocks; read again allowing them
+                columns, total_rows, stats = _scan_chunks(
+                    _iter_arrow_chunks(file_path, dictionary_columns, newlines_in_values=True)
+                )
+        except pa.ArrowInvalid:
+            # pyarrow fixes column types from the first block; pandas re-infers per chunk
+            reader = pd.read_csv(
+                file_path,
+                chunksize=CHUNK_SIZE,
+                low_memory=True,
+                dtype={column: 'category' for column in dictionary_columns}
+            )
+            columns, total_rows, stats = _scan_chunks(reader)
+        
+        # Get basic info about the dataset
+        file_info = {
+            'file_name': csv_file,
+            'total_rows': total_rows,
+            'total_columns': len(columns),
+            'columns': {}
+        }
+        
+        # Build column info from the accumulated stats
+        column_infos = file_info['columns']
+        for column, head in head_df.items():
+            column_infos[column] = _finalize_column_stats(stats[column], head)
+        
+        return csv_file, file_info
+        
+    except Exception as e:
+        return csv_file, {'error': str(e)}
+
+def _load_cache(cache_file: str) -> Dict[Tuple[str, int, int], Dict[str, Any]]:
+    """
+    Load previously computed file info, keyed by (file name, mtime_ns, size).
+    
+    Args:
+        cache_file (str): Path to the pickle written by _save_cache
+        
+    Returns:
+        Dict[Tuple[str, int, int], Dict[str, Any]]: Cached file info, empty if unavailable
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+
+def _save_cache(cache: Dict[Tuple[str, int, int], Dict[str, Any]], cache_file: str):
+    """
+    Persist file info so unchanged CSVs are not parsed again on the next run.
+    
+    Args:
+        cache (Dict[Tuple[str, int, int], Dict[str, Any]]): File info keyed by (file name, mtime_ns, size)
+        cache_file (str): Path to write the pickle to
+    """
+    with open(cache_file, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def analyze_csv_files(data_directory: str, cache_file: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
     """
     Analyze all CSV files in the specified directory and extract headers with their data types.
     
+    Files are independent, so each one is analyzed in its own worker process.
+    
     Args:
         data_directory (str): Path to the directory containing CSV files
+        cache_file (Optional[str]): Pickle of earlier results; files whose name,
+            mtime and size are unchanged are taken from it instead of re-parsed
         
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary with filename as key and column info as value
     """
     results = {}
     
-    # Get all CSV files in the directory
-    csv_files = [f for f in os.listdir(data_directory) if f.endswith('.csv')]
+    # Get all CSV files in the directory; DirEntry carries the name, path and cached type
+    with os.scandir(data_directory) as entries:
+        csv_entries = [e for e in entries if e.name.endswith('.csv') and e.is_file()]
     
-    print(f"Found {len(csv_files)} CSV files in {data_directory}")
+    print(f"Found {len(csv_entries)} CSV files in {data_directory}")
     print("-" * 60)
     
-    for csv_file in csv_files:
-        file_path = os.path.join(data_directory, csv_file)
-        print(f"\nAnalyzing: {csv_file}")
+    if not csv_entries:
+        return results
+    
+    cache = _load_cache(cache_file) if cache_file else {}
+    keys = {}
+    for entry in csv_entries:
+        st = entry.stat()
+        keys[entry.path] = (entry.name, st.st_mtime_ns, st.st_size)
+    
+    analyzed = {}
+    pending = [path for path, key in keys.items() if key not in cache]
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            for path, (_, file_info) in zip(pending, executor.map(_analyze_one, pending)):
+                analyzed[path] = file_info
+    
+    updated_cache = {}
+    for path, key in keys.items():
+        csv_file = key[0]
+        cached = path not in analyzed
+        file_info = cache[key] if cached else analyzed[path]
+        results[csv_file] = file_info
         
-        try:
-            # Read the CSV file
-            df = pd.read_csv(file_path)
-            
-            # Get basic info about the dataset
-            file_info = {
-                'file_name': csv_file,
-                'total_rows': len(df),
-                'total_columns': len(df.columns),
-                'columns': {}
-            }
-            
-            # Analyze each column
-            for column in df.columns:
-                column_info = {
-                    'dtype': str(df[column].dtype),
-                    'non_null_count': df[column].count(),
-                    'null_count': df[column].isnull().sum(),
-                    'unique_count': df[column].nunique(),
-                    'sample_values': df[column].dropna().head(3).tolist() if not df[column].empty else []
-                }
-                
-                # Try to infer better data type
-                if df[column].dtype == 'object':
-                    # Check if it's datetime
-                    try:
-                        pd.to_datetime(df[column].dropna().head(100), errors='raise')
-                        column_info['suggested_type'] = 'datetime'
-                    except:
-                        # Check if it's numeric but stored as string
-                        try:
-                            pd.to_numeric(df[column].dropna().head(100), errors='raise')
-                            column_info['suggested_type'] = 'numeric'
-                        except:
-                            column_info['suggested_type'] = 'string'
-                elif df[column].dtype in ['int64', 'float64']:
-                    column_info['suggested_type'] = 'numeric'
-                else:
-                    column_info['suggested_type'] = str(df[column].dtype)
-                
-                file_info['columns'][column] = column_info
-            
-            results[csv_file] = file_info
-            
-            # Print summary for this file
-            print(f"  - Rows: {file_info['total_rows']:,}")
-            print(f"  - Columns: {file_info['total_columns']}")
-            print(f"  - Headers: {list(df.columns)}")
-            
-        except Exception as e:
-            print(f"  Error reading {csv_file}: {str(e)}")
-            results[csv_file] = {'error': str(e)}
+        # Print summary for this file
+        print(f"\nAnalyzing: {csv_file}" + (" (cached)" if cached else ""))
+        if 'error' in file_info:
+            print(f"  Error reading {csv_file}: {file_info['error']}")
+            continue
+        updated_cache[key] = file_info
+        print(f"  - Rows: {file_info['total_rows']:,}")
+        print(f"  - Columns: {file_info['total_columns']}")
+        print(f"  - Headers: {list(file_info['columns'])}")
+    
+    if cache_file:
+        _save_cache(updated_cache, cache_file)
     
     return results
 
@@ -85,57 +481,127 @@ def print_detailed_analysis(results: Dict[str, Dict[str, Any]]):
     """
     Print detailed analysis of all CSV files.
     
+    The report is built in a buffer and written to stdout in one go.
+    
     Args:
         results (Dict[str, Dict[str, Any]]): Results from analyze_csv_files function
     """
-    print("\n" + "="*80)
-    print("DETAILED ANALYSIS OF ALL CSV FILES")
-    print("="*80)
+    buf = io.StringIO()
+    buf.write("\n" + "="*80 + "\n")
+    buf.write("DETAILED ANALYSIS OF ALL CSV FILES\n")
+    buf.write("="*80 + "\n")
     
     for filename, file_info in results.items():
         if 'error' in file_info:
-            print(f"\n❌ {filename}: {file_info['error']}")
+            buf.write(f"\n❌ {filename}: {file_info['error']}\n")
             continue
             
-        print(f"\n📄 {filename}")
-        print(f"   Total Rows: {file_info['total_rows']:,}")
-        print(f"   Total Columns: {file_info['total_columns']}")
-        print(f"   Columns and Data Types:")
+        buf.write(f"\n📄 {filename}\n")
+        buf.write(f"   Total Rows: {file_info['total_rows']:,}\n")
+        buf.write(f"   Total Columns: {file_info['total_columns']}\n")
+        buf.write("   Columns and Data Types:\n")
         
         for col_name, col_info in file_info['columns'].items():
             null_percentage = (col_info['null_count'] / file_info['total_rows']) * 100
-            print(f"     • {col_name}")
-            print(f"       - Current Type: {col_info['dtype']}")
-            print(f"       - Suggested Type: {col_info['suggested_type']}")
-            print(f"       - Non-null: {col_info['non_null_count']:,} ({100-null_percentage:.1f}%)")
-            print(f"       - Unique Values: {col_info['unique_count']:,}")
+            buf.write(f"     • {col_name}\n")
+            buf.write(f"       - Current Type: {col_info['dtype']}\n")
+            buf.write(f"       - Suggested Type: {col_info['suggested_type']}\n")
+            buf.write(f"       - Non-null: {col_info['non_null_count']:,} ({100-null_percentage:.1f}%)\n")
+            buf.write(f"       - Unique Values: {col_info['unique_count']:,}\n")
             if col_info['sample_values']:
-                print(f"       - Sample Values: {col_info['sample_values']}")
+                buf.write(f"       - Sample Values: {col_info['sample_values']}\n")
+    
+    sys.stdout.write(buf.getvalue())
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize values the JSON encoders do not handle natively.
+    
+    Counts are kept as NumPy scalars until serialization; they are written as
+    numbers rather than strings.
+    
+    Args:
+        obj (Any): The value to serialize
+        
+    Returns:
+        Any: A JSON-compatible value
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
 
 def save_results_to_json(results: Dict[str, Dict[str, Any]], output_file: str):
     """
     Save the analysis results to a JSON file.
     
+    Uses orjson's C encoder when it is installed, otherwise the json module.
+    
     Args:
         results (Dict[str, Dict[str, Any]]): Results from analyze_csv_files function
         output_file (str): Path to save the JSON file
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                default=_json_default
+            ))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False, default=_json_default)
+    print(f"\n💾 Results saved to: {output_file}")
+
+def save_results_to_feather(results: Dict[str, Dict[str, Any]], output_file: str):
+    """
+    Save the analysis results as a Feather (Arrow IPC) table with one row per column.
+    
+    Much smaller and faster to write and re-read than the indented JSON;
+    files that failed to load are left out.
+    
+    Args:
+        results (Dict[str, Dict[str, Any]]): Results from analyze_csv_files function
+        output_file (str): Path to save the Feather file
+    """
+    rows = []
+    for filename, file_info in results.items():
+        if 'error' in file_info:
+            continue
+        for col_name, col_info in file_info['columns'].items():
+            rows.append({
+                'file': filename,
+                'column': col_name,
+                'dtype': col_info['dtype'],
+                'non_null': col_info['non_null_count'],
+                'null': col_info['null_count'],
+                'unique': col_info['unique_count'],
+                'unique_is_lower_bound': col_info.get('unique_count_is_lower_bound', False),
+                'suggested_type': col_info['suggested_type'],
+                # Samples mix numbers and text across columns; store them as text
+                'sample_values': [str(value) for value in col_info['sample_values']]
+            })
+    
+    feather.write_feather(pd.DataFrame(rows), output_file, compression='lz4')
     print(f"\n💾 Results saved to: {output_file}")
 
 def create_summary_table(results: Dict[str, Dict[str, Any]]):
     """
     Create a summary table of all files and their column counts.
     
+    The table is built in a buffer and written to stdout in one go.
+    
     Args:
         results (Dict[str, Dict[str, Any]]): Results from analyze_csv_files function
     """
-    print("\n" + "="*80)
-    print("SUMMARY TABLE")
-    print("="*80)
-    print(f"{'File Name':<35} {'Rows':<12} {'Columns':<10} {'Status'}")
-    print("-" * 80)
+    row_format = "{:<35} {:<12} {:<10} {}\n"
+    rule = "-" * 80 + "\n"
+    
+    buf = io.StringIO()
+    buf.write("\n" + "="*80 + "\n")
+    buf.write("SUMMARY TABLE\n")
+    buf.write("="*80 + "\n")
+    buf.write(row_format.format('File Name', 'Rows', 'Columns', 'Status'))
+    buf.write(rule)
     
     total_files = 0
     total_columns = 0
@@ -144,23 +610,31 @@ def create_summary_table(results: Dict[str, Dict[str, Any]]):
     for filename, file_info in results.items():
         total_files += 1
         if 'error' in file_info:
-            print(f"{filename:<35} {'ERROR':<12} {'N/A':<10} ❌")
+            buf.write(row_format.format(filename, 'ERROR', 'N/A', '❌'))
         else:
             rows = f"{file_info['total_rows']:,}"
             cols = file_info['total_columns']
             total_columns += cols
             successful_files += 1
-            print(f"{filename:<35} {rows:<12} {cols:<10} ✅")
+            buf.write(row_format.format(filename, rows, cols, '✅'))
     
-    print("-" * 80)
-    print(f"Total Files: {total_files}")
-    print(f"Successful: {successful_files}")
-    print(f"Total Unique Columns: {total_columns}")
+    buf.write(rule)
+    buf.write(f"Total Files: {total_files}\n")
+    buf.write(f"Successful: {successful_files}\n")
+    buf.write(f"Total Unique Columns: {total_columns}\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze the raw Olist CSV files")
+    parser.add_argument('--json', action='store_true', help="also write the indented JSON report")
+    args = parser.parse_args()
+    
     # Configuration
     DATA_DIRECTORY = r"F:\olist-ecommerce-pipeline\data\raw"
     OUTPUT_JSON = r"F:\olist-ecommerce-pipeline\data\processed\csv_analysis_results.json"
+    OUTPUT_FEATHER = r"F:\olist-ecommerce-pipeline\data\processed\csv_analysis_results.feather"
+    CACHE_FILE = r"F:\olist-ecommerce-pipeline\data\processed\csv_analysis_cache.pkl"
     
     print("🔍 Starting CSV Analysis...")
     print(f"📁 Data Directory: {DATA_DIRECTORY}")
@@ -174,7 +648,7 @@ if __name__ == "__main__":
     os.makedirs(os.path.dirname(OUTPUT_JSON), exist_ok=True)
     
     # Analyze all CSV files
-    results = analyze_csv_files(DATA_DIRECTORY)
+    results = analyze_csv_files(DATA_DIRECTORY, CACHE_FILE)
     
     # Print detailed analysis
     print_detailed_analysis(results)
@@ -182,7 +656,9 @@ if __name__ == "__main__":
     # Create summary table
     create_summary_table(results)
     
-    # Save results to JSON
-    save_results_to_json(results, OUTPUT_JSON)
+    # Save results to Feather, plus JSON for human inspection when asked
+    save_results_to_feather(results, OUTPUT_FEATHER)
+    if args.json:
+        save_results_to_json(results, OUTPUT_JSON)
     
-    print(f"\n🎉 Analysis complete! Check {OUTPUT_JSON} for detailed results.")
\ No newline at end of file
+    print(f"\n🎉 Analysis complete! Check {OUTPUT_JSON if args.json else OUTPUT_FEATHER} for detailed results.")
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Shared SQLAlchemy engines for the olist_analytics database.
+
+get_engine returns one pooled engine per port for the whole process, so
+repeated callers reuse warm, authenticated connections instead of each
+building its own pool.
+"""
+
+import socket
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+
+DATABASE_HOST = "127.0.0.1"
+DATABASE_URL = "postgresql+psycopg://olist_user:olist_pass123@" + DATABASE_HOST + ":{port}/olist_analytics"
+
+def port_is_open(port, timeout=1.0):
+    """Check that something accepts TCP connections on the port before libpq tries it"""
+    try:
+        socket.create_connection((DATABASE_HOST, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+@lru_cache(maxsize=None)
+def get_engine(port=5432):
+    """Return the process-wide pooled engine for the given port"""
+    return create_engine(
+        DATABASE_URL.format(port=port),
+        # Parameters are bound server-side and statements are prepared after 5 runs
+        connect_args={"prepare_threshold": 5, "connect_timeout": 2},
+        pool_size=10,
+        max_overflow=5,
+        pool_recycle=1800,
+        pool_pre_ping=True
+    )
@@ -21,9 +21,15 @@ Manual steps in Airbyte UI (http://localhost:8000):
    - Schedule: Manual (or set as needed)
 """
 
+import hashlib
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional, json is used when it is not installed
+    orjson = None
+
 def generate_file_config():
     """Generate configuration for CSV files"""
     
@@ -39,24 +45,35 @@ def generate_file_config():
         "product_category_name_translation.csv"
     ]
     
-    config = {
-        "files": [],
-        "target_schema": "raw_data"
-    }
-    
-    for file in csv_files:
-        table_name = file.replace(".csv", "")
-        config["files"].append({
+    # ND-JSON: a header record with the target schema, then one record per file,
+    # so consumers can process the list line by line
+    records = [{"_meta": {"target_schema": "raw_data"}}] + [
+        {
             "file": f"data/raw/{file}",
-            "table": table_name,
+            "table": Path(file).stem,
             "format": "csv",
             "header": True
-        })
+        }
+        for file in csv_files
+    ]
+    
+    # Skip the rewrite when the existing file was generated from identical content,
+    # so its mtime only changes when the config does
+    output_file = Path("configs/airbyte_source_config.ndjson")
+    config_hash = hashlib.sha256(json.dumps(records, sort_keys=True).encode()).hexdigest()
+    if output_file.exists() and config_hash in output_file.read_text():
+        print("Configuration up to date: configs/airbyte_source_config.ndjson")
+        return
+    records[0]["_meta"]["_hash"] = config_hash
     
-    with open("configs/airbyte_source_config.json", "w") as f:
-        json.dump(config, f, indent=2)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_file.write_bytes(b"".join(orjson.dumps(record) + b"\n" for record in records))
+    else:
+        with open(output_file, "w") as f:
+            f.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
     
-    print("Configuration generated: configs/airbyte_source_config.json")
+    print("Configuration generated: configs/airbyte_source_config.ndjson")
 
 if __name__ == "__main__":
     generate_file_config()
\ No newline at end of file